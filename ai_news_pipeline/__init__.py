@@ -0,0 +1,8 @@
+"""AI news pipeline: collects Medium and RSS articles, summarizes them and
+evaluates their relevance for the campaign.
+
+Every module is safe to import: database connections, browsers and heavy
+third-party packages (selenium, googleapiclient, feedparser, bs4, openai,
+sqlalchemy, pyarrow) are only touched inside the functions that need them.
+Each stage has a main() entry point, see `python -m ai_news_pipeline --help`.
+"""
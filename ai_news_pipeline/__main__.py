@@ -0,0 +1,36 @@
+import sys
+import importlib
+
+# Command name -> module with a main() entry point. Modules are imported only
+# when their command runs, so each invocation pays only for what it uses.
+COMMANDS = {
+    'medium-links': 'ai_news_pipeline.medium_links',
+    'medium-scrape': 'ai_news_pipeline.medium_scraper',
+    'rss': 'ai_news_pipeline.rss',
+    'summarize': 'ai_news_pipeline.summarize',
+    'merge': 'ai_news_pipeline.merge',
+    'evaluate': 'ai_news_pipeline.evaluate',
+    'search': 'ai_news_pipeline.search',
+    'snapshot': 'ai_news_pipeline.snapshot',
+    'batch-stub': 'ai_news_pipeline.batch_stub_server',
+    'startup-benchmark': 'ai_news_pipeline.startup_benchmark',
+}
+
+# Commands whose main() takes the remaining command line arguments
+COMMANDS_WITH_ARGS = {'summarize', 'evaluate', 'search', 'startup-benchmark'}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print("Usage: python -m ai_news_pipeline <command> [args]")
+        print("Commands: " + ', '.join(COMMANDS))
+        return 0 if argv and argv[0] in ('-h', '--help') else 1
+
+    command, args = argv[0], argv[1:]
+    module = importlib.import_module(COMMANDS[command])
+    if command in COMMANDS_WITH_ARGS:
+        return module.main(args)
+    return module.main()
+
+if __name__ == "__main__":
+    sys.exit(main())
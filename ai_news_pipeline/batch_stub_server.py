@@ -0,0 +1,124 @@
+import json
+import uuid
+import email
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the OpenAI Files and Batches endpoints used by openai_batch.py.
+# Every batch completes immediately with canned replies, e.g.:
+#   python -m ai_news_pipeline batch-stub
+#   OPENAI_BASE_URL=http://localhost:8765/v1 python -m ai_news_pipeline summarize --batch
+
+HOST = 'localhost'
+PORT = 8765
+
+CANNED_SUMMARY = "Canned summary returned by the local batch stub."
+CANNED_EVALUATION = "- **Relevant**: Yes\n- **Explanation**: Canned evaluation returned by the local batch stub."
+
+files = {}
+batches = {}
+
+# Requests with these custom ids fail and go to the batch error file
+failing_custom_ids = set()
+
+def canned_reply(body):
+    prompt = body['messages'][-1]['content']
+    content = CANNED_EVALUATION if '**Relevant**' in prompt else CANNED_SUMMARY
+    return {
+        'id': f"chatcmpl-{uuid.uuid4().hex}",
+        'object': 'chat.completion',
+        'model': body.get('model'),
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}]
+    }
+
+def store_file(lines):
+    # Like the real API, an empty output or error file is not created at all
+    if not lines:
+        return None
+    file_id = f"file-{uuid.uuid4().hex}"
+    files[file_id] = ('\n'.join(lines) + '\n').encode('utf-8')
+    return file_id
+
+def run_batch(input_file_id):
+    output_lines = []
+    error_lines = []
+    for line in files[input_file_id].decode('utf-8').splitlines():
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        if request['custom_id'] in failing_custom_ids:
+            error_lines.append(json.dumps({
+                'id': f"batch_req_{uuid.uuid4().hex}",
+                'custom_id': request['custom_id'],
+                'response': None,
+                'error': {'code': 'stub_failure', 'message': 'Request failed in the local batch stub.'}
+            }))
+            continue
+        output_lines.append(json.dumps({
+            'id': f"batch_req_{uuid.uuid4().hex}",
+            'custom_id': request['custom_id'],
+            'response': {'status_code': 200, 'body': canned_reply(request['body'])},
+            'error': None
+        }))
+    return store_file(output_lines), store_file(error_lines), len(output_lines), len(error_lines)
+
+class StubHandler(BaseHTTPRequestHandler):
+    def send_json(self, payload, status=200):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def read_body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def do_POST(self):
+        if self.path == '/v1/files':
+            # Parse the multipart upload with the email package
+            raw = b'Content-Type: ' + self.headers['Content-Type'].encode('utf-8') + b'\r\n\r\n' + self.read_body()
+            message = email.message_from_bytes(raw)
+            for part in message.get_payload():
+                if part.get_param('name', header='content-disposition') == 'file':
+                    file_id = f"file-{uuid.uuid4().hex}"
+                    files[file_id] = part.get_payload(decode=True)
+                    return self.send_json({'id': file_id, 'object': 'file', 'purpose': 'batch'})
+            return self.send_json({'error': {'message': 'file part missing'}}, status=400)
+
+        if self.path == '/v1/batches':
+            request = json.loads(self.read_body())
+            output_file_id, error_file_id, completed, failed = run_batch(request['input_file_id'])
+            batch_id = f"batch_{uuid.uuid4().hex}"
+            batches[batch_id] = {
+                'id': batch_id,
+                'object': 'batch',
+                'status': 'completed',
+                'input_file_id': request['input_file_id'],
+                'output_file_id': output_file_id,
+                'error_file_id': error_file_id,
+                'request_counts': {'total': completed + failed, 'completed': completed, 'failed': failed}
+            }
+            return self.send_json(batches[batch_id])
+
+        self.send_json({'error': {'message': 'not found'}}, status=404)
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        if len(parts) == 3 and parts[1] == 'batches' and parts[2] in batches:
+            return self.send_json(batches[parts[2]])
+        if len(parts) == 4 and parts[1] == 'files' and parts[3] == 'content' and parts[2] in files:
+            data = files[parts[2]]
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/jsonl')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        self.send_json({'error': {'message': 'not found'}}, status=404)
+
+def main():
+    print(f"Batch stub listening on http://{HOST}:{PORT}/v1")
+    ThreadingHTTPServer((HOST, PORT), StubHandler).serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import os
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def load_environment():
+    # Load environment variables from .env file once per process
+    from dotenv import load_dotenv
+    load_dotenv()
+
+def get_db_params():
+    """Returns the psycopg2 connection parameters from environment variables."""
+    load_environment()
+    return {
+        'dbname': os.getenv('DB_NAME'),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'host': os.getenv('DB_HOST'),
+        'port': os.getenv('DB_PORT', '5432')
+    }
+
+def get_database_url():
+    params = get_db_params()
+    return f"postgresql://{params['user']}:{params['password']}@{params['host']}:{params['port']}/{params['dbname']}"
+
+@lru_cache(maxsize=None)
+def get_session_factory():
+    # The engine is created on first use, not at import time
+    import sqlalchemy as sa
+    from sqlalchemy.orm import sessionmaker
+    return sessionmaker(bind=sa.create_engine(get_database_url()))
+
+def Session():
+    """Opens a new SQLAlchemy session on the pipeline database."""
+    return get_session_factory()()
@@ -0,0 +1,237 @@
+import os
+import sys
+from datetime import datetime
+
+from ai_news_pipeline.config import Session, get_db_params, load_environment
+from ai_news_pipeline.merge import SAMPLES_PER_BUCKET, ensure_dashboard_rollups, ensure_evaluated_at_column
+
+# Function to connect to the PostgreSQL database
+def get_connection():
+    import psycopg2
+
+    return psycopg2.connect(**get_db_params())
+
+# Function to fetch all records from the 'all_summaries' table with their current relevance
+def fetch_records(conn):
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT a.id, a.title, a.source, a.date, a.summary, r.relevance
+        FROM all_summaries a
+        LEFT JOIN all_relevance_4o r ON r.id = a.id;
+    """)
+    records = cursor.fetchall()
+    cursor.close()
+    conn.commit()
+    return records
+
+def update_dashboard_rollups(cursor, article_id, title, source, date, old_relevance, relevance, explanation):
+    # Move the article from its previous relevance bucket to the new one
+    if date is None:
+        return
+    source = source or 'Unknown'
+    day = date.date()
+    old_relevance = old_relevance or 'Unevaluated'
+
+    if old_relevance != relevance:
+        cursor.execute("""
+            UPDATE dashboard_rollups SET article_count = article_count - 1
+            WHERE source = %s AND day = %s AND relevance = %s;
+        """, (source, day, old_relevance))
+        cursor.execute("""
+            DELETE FROM dashboard_rollups
+            WHERE source = %s AND day = %s AND relevance = %s AND article_count <= 0;
+        """, (source, day, old_relevance))
+        cursor.execute("""
+            INSERT INTO dashboard_rollups (source, day, relevance, article_count)
+            VALUES (%s, %s, %s, 1)
+            ON CONFLICT (source, day, relevance) DO UPDATE
+            SET article_count = dashboard_rollups.article_count + 1;
+        """, (source, day, relevance))
+
+    # Keep the newest explanations of each bucket as dashboard samples
+    cursor.execute("""
+        INSERT INTO dashboard_explanation_samples (article_id, source, day, relevance, title, explanation, evaluated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, NOW())
+        ON CONFLICT (article_id) DO UPDATE
+        SET relevance = EXCLUDED.relevance, explanation = EXCLUDED.explanation, evaluated_at = EXCLUDED.evaluated_at;
+    """, (article_id, source, day, relevance, title, explanation))
+    cursor.execute("""
+        DELETE FROM dashboard_explanation_samples
+        WHERE source = %(source)s AND day = %(day)s AND relevance = %(relevance)s
+          AND article_id NOT IN (
+              SELECT article_id FROM dashboard_explanation_samples
+              WHERE source = %(source)s AND day = %(day)s AND relevance = %(relevance)s
+              ORDER BY evaluated_at DESC
+              LIMIT %(limit)s
+          );
+    """, {'source': source, 'day': day, 'relevance': relevance, 'limit': SAMPLES_PER_BUCKET})
+
+# The prompt template (unchanged)
+prompt_template = """
+You will be provided with **one article summary at a time**. For each article summary, please do the following:
+
+1. **Determine Relevance**: Decide whether the article is relevant to our campaign's topic and objectives. Answer with **"Yes"** or **"No"**.
+2. **Provide a Brief Explanation**: If relevant, briefly explain how the article aligns with the campaign's topic and objectives. If not, briefly explain why it does not. Please keep your explanation concise (1-2 sentences).
+
+**Campaign Details:**
+
+- **Topic of the Campaign**: The influence of AI on human lives.
+- **Target Audience**: Non-IT professionals.
+- **Objectives**:
+  - To show the influence of AI on the job market.
+  - To show threats and opportunities of AI for IT and Non-IT people.
+  - To introduce new models and their features.
+  - To show the influence of AI on economics in the world, individual countries, and industries.
+
+**Output Format:**
+
+For each article summary, please provide:
+
+- **Relevant**: Yes/No
+- **Explanation**: [Your brief explanation here.]
+
+**Please evaluate the following article summary:**
+
+\"\"\"
+{summary}
+\"\"\"
+"""
+
+# Function to build the chat completion request for one article summary
+def build_evaluation_request(summary):
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": prompt_template.format(summary=summary)}],
+        "max_tokens": 500,
+        "temperature": 0
+    }
+
+# Function to parse the assistant's reply and save it to 'all_relevance_4o'; database
+# errors are raised so a batch job does not record the result as applied
+def save_evaluation(conn, cursor, record, assistant_reply):
+    article_id, title, source, date, summary, old_relevance = record
+
+    # Parse the assistant's reply to get relevance and explanation
+    lines = assistant_reply.strip().split('\n')
+    relevance = ''
+    explanation = ''
+    for line in lines:
+        if '- **Relevant**:' in line:
+            relevance = line.split(':', 1)[1].strip()
+        elif '- **Explanation**:' in line:
+            explanation = line.split(':', 1)[1].strip()
+
+    # Check if relevance and explanation were parsed correctly
+    if not relevance or not explanation:
+        print(f"Failed to parse relevance or explanation for article ID {article_id}. Reply: {assistant_reply}")
+        return
+
+    try:
+        # Insert the data into 'all_relevance_4o' table
+        insert_query = """
+        INSERT INTO all_relevance_4o (id, title, source, date, relevance, explanation, evaluated_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (id) DO UPDATE
+        SET relevance = EXCLUDED.relevance, explanation = EXCLUDED.explanation, evaluated_at = EXCLUDED.evaluated_at;
+        """
+        cursor.execute(insert_query, (article_id, title, source, date, relevance, explanation, datetime.now()))
+
+        # Keep the dashboard rollups in step with the new evaluation
+        update_dashboard_rollups(cursor, article_id, title, source, date, old_relevance, relevance, explanation)
+        conn.commit()
+    except Exception as e:
+        print(f"Error saving evaluation for article ID {article_id}: {e}")
+        conn.rollback()
+        raise
+
+# Function to re-evaluate all records as one asynchronous OpenAI batch job
+def evaluate_records_in_batch(conn, cursor, records):
+    from ai_news_pipeline.openai_batch import run_batch_job
+
+    records_by_id = {f"article-{record[0]}": record for record in records}
+
+    def build_requests():
+        for custom_id, record in records_by_id.items():
+            yield {'custom_id': custom_id, 'body': build_evaluation_request(record[4])}
+
+    def handle_result(custom_id, assistant_reply):
+        record = records_by_id.get(custom_id)
+        if not record:
+            print(f"Batch result {custom_id} does not match any article")
+            return
+        save_evaluation(conn, cursor, record, assistant_reply)
+
+    return run_batch_job('all_relevance_4o', build_requests, handle_result)
+
+# Function to evaluate records one by one with interactive API calls
+def evaluate_records(conn, cursor, records):
+    import openai
+
+    load_environment()
+    openai.api_key = os.getenv('OPENAI_API_KEY')
+
+    # Process each record
+    for record in records:
+        article_id = record[0]
+
+        # Call OpenAI API
+        try:
+            response = openai.ChatCompletion.create(**build_evaluation_request(record[4]))
+
+            # Extract the assistant's reply
+            if response and 'choices' in response and len(response['choices']) > 0:
+                assistant_reply = response['choices'][0]['message']['content']
+            else:
+                print(f"Empty or invalid response from OpenAI for article ID {article_id}.")
+                continue
+
+            save_evaluation(conn, cursor, record, assistant_reply)
+
+        except Exception as e:
+            print(f"Error processing article ID {article_id}: {e}")
+            continue
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Connect to the PostgreSQL database
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+    except Exception as e:
+        print("Error connecting to the database:", e)
+        return
+
+    # The evaluator may run before the first merge on this schema; without the
+    # rollup tables every save_evaluation() would fail and roll back
+    try:
+        with Session() as session:
+            ensure_dashboard_rollups(session)
+            ensure_evaluated_at_column(session)
+            session.commit()
+    except Exception as e:
+        print("Error preparing the rollup and evaluation tables:", e)
+        cursor.close()
+        conn.close()
+        return
+
+    records = fetch_records(conn)
+
+    # Bulk re-evaluation: python -m ai_news_pipeline evaluate --batch
+    if '--batch' in argv:
+        try:
+            evaluate_records_in_batch(conn, cursor, records)
+        except Exception as e:
+            # Results not saved yet stay pending; the next --batch run resumes the job
+            print(f"Batch evaluation stopped, rerun to resume: {e}")
+    else:
+        evaluate_records(conn, cursor, records)
+
+    # Close the database connection
+    cursor.close()
+    conn.close()
+
+    print("Processing completed successfully.")
+
+if __name__ == "__main__":
+    main()
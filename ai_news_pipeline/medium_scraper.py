@@ -0,0 +1,303 @@
+import os
+import csv
+import time
+from io import StringIO
+
+from ai_news_pipeline.config import get_db_params, load_environment
+from ai_news_pipeline.politeness import RETRY_STATUSES, get_scheduler, parse_retry_after
+from ai_news_pipeline.triage import get_threshold, score_link
+
+SPREADSHEET_ID = '13bts6J26AhmMlPI2cK1wHVPilAXdTrmHJeFjPG94mio'
+
+# Failed scrapes (paywall, timeout) before a link is given up on
+MAX_SCRAPE_ATTEMPTS = 3
+
+def get_max_articles_per_run():
+    # Browser sessions per run; triaged links beyond this wait in 'parked_links'
+    load_environment()
+    return int(os.getenv('MAX_ARTICLES_PER_RUN', '15'))
+
+# Function to save the article to the PostgreSQL database
+def save_article_to_db(cursor, article_data):
+    try:
+        cursor.execute('''
+            INSERT INTO articles (url, title, content)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (url) DO NOTHING
+        ''', (article_data['url'], article_data['title'], article_data['content']))
+    except Exception as e:
+        print(f"Database error during insert: {e}")
+        cursor.connection.rollback()
+
+# Function to resolve tracking URLs; the caller holds the host slot for the whole page visit
+def resolve_url(url):
+    import requests
+
+    try:
+        resp = requests.head(url, allow_redirects=True, timeout=10)
+        if resp.status_code in RETRY_STATUSES:
+            delay = parse_retry_after(resp.headers.get('Retry-After'))
+            get_scheduler().defer(resp.url or url, delay if delay is not None else 30)
+        return resp.url
+    except Exception as e:
+        print(f"Failed to resolve URL {url}: {e}")
+        return url
+
+# Function to scrape Medium articles
+def scrape_medium_article(driver, url):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+    article_data = {'url': url, 'title': None, 'content': None}
+    try:
+        # One page visit (tracking-link HEAD with its redirects plus the page
+        # load) costs a single slot of the host's politeness budget
+        with get_scheduler().slot(url):
+            resolved_url = resolve_url(url)
+            print(f"Resolved URL: {resolved_url}")
+            driver.get(resolved_url)
+
+        # Scroll to bottom to trigger any lazy-loaded content
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(2)
+
+        # Wait for the article to be visible
+        try:
+            WebDriverWait(driver, 30).until(
+                EC.visibility_of_element_located((By.TAG_NAME, 'article'))
+            )
+        except TimeoutException:
+            print(f"Timeout while waiting for the article to load at {resolved_url}")
+            return None
+
+        # Check for paywall or login requirement
+        if "Get unlimited access" in driver.page_source or "Become a member" in driver.page_source:
+            print(f"Article at {resolved_url} requires login or subscription.")
+            return None
+
+        # Retry logic for stale elements
+        for attempt in range(3):
+            try:
+                # Re-fetch elements
+                article_element = driver.find_element(By.TAG_NAME, 'article')
+                article_text = article_element.text
+
+                title_element = driver.find_element(By.TAG_NAME, 'h1')
+                article_title = title_element.text
+
+                article_data['url'] = resolved_url
+                article_data['title'] = article_title
+                article_data['content'] = article_text
+
+                print(f"Medium article '{article_title}' successfully scraped.")
+                return article_data
+
+            except StaleElementReferenceException:
+                if attempt < 2:
+                    print(f"StaleElementReferenceException encountered. Retrying ({attempt + 1}/3)...")
+                    time.sleep(2)
+                    continue
+                else:
+                    print(f"Failed after multiple retries due to stale element.")
+                    return None
+            except Exception as e:
+                print(f"An error occurred while scraping Medium article {url}: {e}")
+                return None
+
+    except Exception as e:
+        print(f"An error occurred while scraping Medium article {url}: {e}")
+        return None
+
+# Function to start a headless Chrome WebDriver
+def create_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    # Set up Chrome options
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+
+    user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko)"
+    options.add_argument(f'user-agent={user_agent}')
+
+    # Suppress irrelevant error messages
+    options.add_argument('--log-level=3')
+
+    return webdriver.Chrome(options=options)
+
+# Function to fetch Medium links with their title, snippet and triage score from the Google Sheet
+def fetch_medium_links(spreadsheet_id):
+    csv_url = f'https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=csv'
+
+    response = get_scheduler().request('GET', csv_url)
+    if response.status_code != 200:
+        print(f"Failed to fetch CSV data. Status code: {response.status_code}")
+        return []
+
+    csv_data = response.content.decode('utf-8')
+    f = StringIO(csv_data)
+    reader = csv.reader(f)
+    links = []
+    for row in reader:
+        if not row or 'medium.com' not in row[0]:
+            continue
+        title = row[1] if len(row) > 1 else ''
+        snippet = row[2] if len(row) > 2 else ''
+        try:
+            score = float(row[3])
+        except (IndexError, ValueError):
+            # Rows without metadata (older sheets) are never held back
+            score = score_link(title, snippet) if title or snippet else None
+        links.append({'url': row[0], 'title': title, 'snippet': snippet, 'score': score})
+    return links
+
+# Function to split links into the ones to scrape now and the ones to park
+def triage_links(links, threshold, capacity):
+    def sort_key(link):
+        return link['score'] if link['score'] is not None else 1.0
+
+    ranked = sorted(links, key=sort_key, reverse=True)
+    selected = [link for link in ranked if sort_key(link) >= threshold][:capacity]
+    selected_urls = {link['url'] for link in selected}
+    parked = [link for link in ranked if link['url'] not in selected_urls]
+    return selected, parked
+
+def ensure_parked_links_table(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS parked_links (
+            url TEXT PRIMARY KEY,
+            title TEXT,
+            snippet TEXT,
+            score REAL,
+            parked_at TIMESTAMP DEFAULT NOW(),
+            scraped_at TIMESTAMP,
+            attempts INTEGER DEFAULT 0
+        )
+    ''')
+    cursor.execute('''
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'parked_links' AND column_name = 'attempts'
+    ''')
+    if not cursor.fetchone():
+        cursor.execute('ALTER TABLE parked_links ADD COLUMN attempts INTEGER DEFAULT 0')
+        print("Column 'attempts' added to 'parked_links' table.")
+
+# Function to find sheet links that were already scraped or given up on; the
+# sheet keeps the digest until the next one, so the same links come back every run
+def get_finished_urls(cursor, urls):
+    cursor.execute('''
+        SELECT url FROM parked_links
+        WHERE url = ANY(%s) AND (scraped_at IS NOT NULL OR attempts >= %s)
+    ''', (list(urls), MAX_SCRAPE_ATTEMPTS))
+    return {url for (url,) in cursor.fetchall()}
+
+# Function to keep low-score links for a later run instead of dropping them
+def park_links(cursor, links):
+    for link in links:
+        cursor.execute('''
+            INSERT INTO parked_links (url, title, snippet, score)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (url) DO NOTHING
+        ''', (link['url'], link['title'], link['snippet'], link['score']))
+
+# Function to take the best links parked in earlier runs when this run has spare capacity
+def get_parked_links(cursor, limit, exclude_urls):
+    if limit <= 0:
+        return []
+    cursor.execute('''
+        SELECT url, title, snippet, score FROM parked_links
+        WHERE scraped_at IS NULL AND attempts < %s AND NOT (url = ANY(%s))
+        ORDER BY score DESC NULLS LAST, parked_at
+        LIMIT %s
+    ''', (MAX_SCRAPE_ATTEMPTS, list(exclude_urls), limit))
+    return [{'url': url, 'title': title, 'snippet': snippet, 'score': score}
+            for url, title, snippet, score in cursor.fetchall()]
+
+# Function to record a scrape of a sheet or parked link; only a success sets scraped_at
+def record_scrape_attempt(cursor, link, succeeded):
+    cursor.execute('''
+        INSERT INTO parked_links (url, title, snippet, score, scraped_at, attempts)
+        VALUES (%s, %s, %s, %s, CASE WHEN %s THEN NOW() END, 1)
+        ON CONFLICT (url) DO UPDATE SET
+            scraped_at = COALESCE(EXCLUDED.scraped_at, parked_links.scraped_at),
+            attempts = COALESCE(parked_links.attempts, 0) + 1
+    ''', (link['url'], link['title'], link['snippet'], link['score'], succeeded))
+
+def main():
+    import psycopg2
+
+    driver = None
+    conn = None
+    cursor = None
+    try:
+        # Initialize the WebDriver
+        driver = create_driver()
+
+        # Connect to PostgreSQL database
+        conn = psycopg2.connect(**get_db_params())
+        cursor = conn.cursor()
+
+        # Create the articles table if it doesn't exist
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                id SERIAL PRIMARY KEY,
+                url TEXT UNIQUE,
+                title TEXT,
+                content TEXT
+            )
+        ''')
+
+        ensure_parked_links_table(cursor)
+        conn.commit()
+
+        # Scrape the best links first; the rest is parked for a later run
+        capacity = get_max_articles_per_run()
+        links = fetch_medium_links(SPREADSHEET_ID)
+        finished_urls = get_finished_urls(cursor, [link['url'] for link in links])
+        if finished_urls:
+            print(f"Skipping {len(finished_urls)} links scraped or given up on in earlier runs.")
+        links = [link for link in links if link['url'] not in finished_urls]
+        selected, parked = triage_links(links, get_threshold(), capacity)
+        park_links(cursor, parked)
+        conn.commit()
+        if parked:
+            print(f"Parked {len(parked)} low-score or overflow links.")
+
+        # Spare capacity goes to the best links parked in earlier runs; links from
+        # this digest that missed the threshold stay parked
+        selected += get_parked_links(cursor, capacity - len(selected), {link['url'] for link in links})
+
+        if not selected:
+            print("No Medium URLs to process.")
+        else:
+            for link in selected:
+                print(f"Scraping link with triage score {link['score']}: {link['title'] or link['url']}")
+                article_data = scrape_medium_article(driver, link['url'])
+                if article_data:
+                    save_article_to_db(cursor, article_data)
+                    conn.commit()
+                else:
+                    conn.rollback()
+                record_scrape_attempt(cursor, link, bool(article_data))
+                conn.commit()
+
+            print("All Medium articles have been processed.")
+
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+        if driver:
+            driver.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+import os
+from datetime import datetime
+
+from ai_news_pipeline.config import Session, load_environment
+
+# Weighted full-text document: title matches rank above summary matches
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce({alias}title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({alias}summary, '')), 'B')
+"""
+
+def index_exists(session, index_name):
+    import sqlalchemy as sa
+
+    return session.execute(
+        sa.text("SELECT 1 FROM pg_indexes WHERE indexname = :index_name"),
+        {'index_name': index_name}
+    ).first() is not None
+
+def create_index_once(session, index_name, ddl):
+    # CREATE INDEX takes a SHARE lock even when the index exists, so only run it when missing
+    import sqlalchemy as sa
+
+    if not index_exists(session, index_name):
+        session.execute(sa.text(ddl))
+        print(f"Index '{index_name}' created.")
+
+def ensure_search_index(session):
+    import sqlalchemy as sa
+
+    # Add the search_vector column once and backfill existing rows
+    column_exists = session.execute(
+        sa.text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'all_summaries' AND column_name = 'search_vector'
+        """)
+    ).first()
+    if not column_exists:
+        session.execute(sa.text("ALTER TABLE all_summaries ADD COLUMN search_vector tsvector"))
+        session.execute(sa.text(f"UPDATE all_summaries SET search_vector = {SEARCH_VECTOR_SQL.format(alias='')}"))
+        print("Column 'search_vector' added to 'all_summaries' table and backfilled.")
+
+    create_index_once(
+        session, 'all_summaries_search_idx',
+        "CREATE INDEX all_summaries_search_idx ON all_summaries USING GIN (search_vector)"
+    )
+    create_index_once(
+        session, 'all_summaries_source_date_idx',
+        "CREATE INDEX all_summaries_source_date_idx ON all_summaries (source, date)"
+    )
+    # Serves the newest-first candidate scan of search.search_summaries()
+    create_index_once(
+        session, 'all_summaries_date_id_idx',
+        "CREATE INDEX all_summaries_date_id_idx ON all_summaries (date DESC, id DESC)"
+    )
+
+# Which tier and model wrote each summary and how long the API call took in
+# milliseconds; NULL for RSS summaries taken from the feed, and latency_ms is
+# NULL for summaries written by a batch job
+ROUTING_COLUMNS = {
+    'model': 'TEXT',
+    'tier': 'TEXT',
+    'latency_ms': 'INTEGER'
+}
+
+def ensure_routing_columns(session):
+    import sqlalchemy as sa
+
+    for table in ('medium_summaries', 'all_summaries'):
+        # medium_summaries only exists once the summarizer has saved a summary
+        if session.execute(sa.text("SELECT to_regclass(:table)"), {'table': table}).scalar() is None:
+            continue
+        existing_columns = {
+            row[0] for row in session.execute(
+                sa.text("SELECT column_name FROM information_schema.columns WHERE table_name = :table"),
+                {'table': table}
+            )
+        }
+        for column, data_type in ROUTING_COLUMNS.items():
+            if column not in existing_columns:
+                session.execute(sa.text(f"ALTER TABLE {table} ADD COLUMN {column} {data_type}"))
+                print(f"Column '{column}' added to '{table}' table.")
+
+def ensure_evaluated_at_column(session):
+    import sqlalchemy as sa
+
+    # When each relevance row was last written; the snapshot export re-exports those days
+    column_exists = session.execute(
+        sa.text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'all_relevance_4o' AND column_name = 'evaluated_at'
+        """)
+    ).first()
+    if not column_exists:
+        session.execute(sa.text("ALTER TABLE all_relevance_4o ADD COLUMN evaluated_at TIMESTAMP"))
+        print("Column 'evaluated_at' added to 'all_relevance_4o' table.")
+    create_index_once(
+        session, 'all_relevance_4o_evaluated_at_idx',
+        "CREATE INDEX all_relevance_4o_evaluated_at_idx ON all_relevance_4o (evaluated_at)"
+    )
+
+# Number of most recent explanations kept per source x day x relevance bucket
+SAMPLES_PER_BUCKET = 5
+
+def ensure_dashboard_rollups(session):
+    import sqlalchemy as sa
+
+    # Pre-aggregated counts read by Dashboard.pbix instead of scanning all_summaries
+    session.execute(sa.text("""
+        CREATE TABLE IF NOT EXISTS dashboard_rollups (
+            source TEXT NOT NULL,
+            day DATE NOT NULL,
+            relevance TEXT NOT NULL,
+            article_count INTEGER NOT NULL,
+            PRIMARY KEY (source, day, relevance)
+        )
+    """))
+    session.execute(sa.text("""
+        CREATE TABLE IF NOT EXISTS dashboard_explanation_samples (
+            article_id INTEGER PRIMARY KEY,
+            source TEXT NOT NULL,
+            day DATE NOT NULL,
+            relevance TEXT NOT NULL,
+            title TEXT,
+            explanation TEXT,
+            evaluated_at TIMESTAMP NOT NULL
+        )
+    """))
+    create_index_once(
+        session, 'dashboard_explanation_samples_bucket_idx',
+        "CREATE INDEX dashboard_explanation_samples_bucket_idx "
+        "ON dashboard_explanation_samples (source, day, relevance, evaluated_at DESC)"
+    )
+    create_index_once(
+        session, 'all_summaries_last_updated_idx',
+        "CREATE INDEX all_summaries_last_updated_idx ON all_summaries (last_updated)"
+    )
+
+    # Build the rollups from scratch once; afterwards they are maintained incrementally
+    rollups_exist = session.execute(sa.text("SELECT 1 FROM dashboard_rollups LIMIT 1")).first()
+    if not rollups_exist:
+        session.execute(sa.text("""
+            INSERT INTO dashboard_rollups (source, day, relevance, article_count)
+            SELECT COALESCE(a.source, 'Unknown'), a.date::date, COALESCE(r.relevance, 'Unevaluated'), COUNT(*)
+            FROM all_summaries a
+            LEFT JOIN all_relevance_4o r ON r.id = a.id
+            WHERE a.date IS NOT NULL
+            GROUP BY 1, 2, 3
+        """))
+        session.execute(sa.text("""
+            INSERT INTO dashboard_explanation_samples (article_id, source, day, relevance, title, explanation, evaluated_at)
+            SELECT id, source, day, relevance, title, explanation, evaluated_at
+            FROM (
+                SELECT a.id, COALESCE(a.source, 'Unknown') AS source, a.date::date AS day, r.relevance,
+                       a.title, r.explanation, COALESCE(a.last_updated, a.date) AS evaluated_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY COALESCE(a.source, 'Unknown'), a.date::date, r.relevance
+                           ORDER BY a.date DESC
+                       ) AS rn
+                FROM all_summaries a
+                JOIN all_relevance_4o r ON r.id = a.id
+                WHERE a.date IS NOT NULL
+            ) ranked
+            WHERE rn <= :samples_per_bucket
+            ON CONFLICT (article_id) DO NOTHING
+        """), {'samples_per_bucket': SAMPLES_PER_BUCKET})
+        print("Dashboard rollup tables built from existing data.")
+
+def add_merged_rows_to_rollups(session, merge_time):
+    import sqlalchemy as sa
+
+    # New rows are not evaluated yet; the evaluator moves them to their relevance bucket
+    result = session.execute(
+        sa.text("""
+        INSERT INTO dashboard_rollups (source, day, relevance, article_count)
+        SELECT COALESCE(a.source, 'Unknown'), a.date::date, COALESCE(r.relevance, 'Unevaluated'), COUNT(*)
+        FROM all_summaries a
+        LEFT JOIN all_relevance_4o r ON r.id = a.id
+        WHERE a.last_updated = :merge_time AND a.date IS NOT NULL
+        GROUP BY 1, 2, 3
+        ON CONFLICT (source, day, relevance) DO UPDATE
+        SET article_count = dashboard_rollups.article_count + EXCLUDED.article_count
+        """),
+        {'merge_time': merge_time}
+    )
+    return result.rowcount
+
+def update_all_summaries():
+    import sqlalchemy as sa
+    from sqlalchemy.exc import SQLAlchemyError
+
+    try:
+        with Session() as session:
+            ensure_search_index(session)
+            ensure_routing_columns(session)
+            ensure_evaluated_at_column(session)
+            ensure_dashboard_rollups(session)
+
+            # One timestamp for the whole merge so the new rows can be found again
+            merge_time = datetime.now()
+
+            # Update from summaries table
+            summaries_result = session.execute(
+                sa.text(f"""
+                INSERT INTO all_summaries (url, title, author, summary, source, date, origin_table, last_updated, search_vector)
+                SELECT s.url, s.title, s.author, s.summary, s.source, s.date, 'summaries' AS origin_table, :current_time,
+                       {SEARCH_VECTOR_SQL.format(alias='s.')}
+                FROM summaries s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM all_summaries a WHERE a.url = s.url
+                )
+                """),
+                {'current_time': merge_time}
+            )
+
+            # Update from medium_summaries table
+            medium_summaries_result = session.execute(
+                sa.text(f"""
+                INSERT INTO all_summaries (url, title, author, summary, source, date, origin_table, last_updated, search_vector,
+                                           model, tier, latency_ms)
+                SELECT ms.url, ms.title, ms.author, ms.summary, ms.source, ms.date, 'medium_summaries' AS origin_table, :current_time,
+                       {SEARCH_VECTOR_SQL.format(alias='ms.')}, ms.model, ms.tier, ms.latency_ms
+                FROM medium_summaries ms
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM all_summaries a WHERE a.url = ms.url
+                )
+                """),
+                {'current_time': merge_time}
+            )
+
+            # Count the new rows into the dashboard rollups in the same transaction
+            rollup_buckets = add_merged_rows_to_rollups(session, merge_time)
+
+            # Commit the transaction
+            session.commit()
+
+            # Get the number of rows inserted
+            summaries_inserted = summaries_result.rowcount
+            medium_summaries_inserted = medium_summaries_result.rowcount
+
+            print(f"Update completed successfully at {datetime.now()}")
+            print(f"Inserted {summaries_inserted} new rows from 'summaries' table")
+            print(f"Inserted {medium_summaries_inserted} new rows from 'medium_summaries' table")
+            print(f"Updated {rollup_buckets} dashboard rollup buckets")
+
+    except SQLAlchemyError as e:
+        print(f"An error occurred with the database: {str(e)}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {str(e)}")
+
+def main():
+    load_environment()
+
+    print("Starting the update process...")
+    update_all_summaries()
+    print("Update process completed.")
+
+    # Refresh the analytics snapshot when one is configured; days evaluated
+    # after this export are rewritten by the next one
+    if os.getenv('SNAPSHOT_DIR'):
+        from ai_news_pipeline.snapshot import export_new_partitions
+        export_new_partitions()
+
+if __name__ == "__main__":
+    main()
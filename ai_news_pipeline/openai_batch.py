@@ -0,0 +1,218 @@
+import os
+import json
+import time
+
+from ai_news_pipeline.config import load_environment
+
+POLL_INTERVAL_SECONDS = 60
+
+FINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+# Batch API limits for one input file; bigger jobs are split into several batches
+MAX_BATCH_REQUESTS = 50000
+MAX_BATCH_FILE_BYTES = 200 * 1000 * 1000
+
+def get_base_url():
+    # OPENAI_BASE_URL can point at a local stand-in (see batch_stub_server.py)
+    load_environment()
+    return os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1').rstrip('/')
+
+def get_state_dir():
+    load_environment()
+    return os.getenv('BATCH_STATE_DIR', 'batch_jobs')
+
+def get_headers():
+    load_environment()
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        raise ValueError("OpenAI API key not found in environment variables")
+    return {'Authorization': f"Bearer {api_key}"}
+
+def write_batch_files(path_prefix, batch_requests):
+    """Writes chat completion requests ({'custom_id', 'body'}) to batch JSONL files.
+
+    A new file is started whenever the next request would go over the Batch API
+    limits. Returns a list of [path, request count] pairs.
+    """
+    files = []
+    f = None
+    size = 0
+    try:
+        for batch_request in batch_requests:
+            line = (json.dumps({
+                'custom_id': batch_request['custom_id'],
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': batch_request['body']
+            }) + '\n').encode('utf-8')
+            if f is None or files[-1][1] >= MAX_BATCH_REQUESTS or size + len(line) > MAX_BATCH_FILE_BYTES:
+                if f is not None:
+                    f.close()
+                path = f"{path_prefix}-{len(files) + 1}.jsonl"
+                f = open(path, 'wb')
+                files.append([path, 0])
+                size = 0
+            f.write(line)
+            files[-1][1] += 1
+            size += len(line)
+    finally:
+        if f is not None:
+            f.close()
+    return files
+
+def submit_batch(path):
+    """Uploads the JSONL file and starts a batch job. Returns the batch id."""
+    import requests
+
+    with open(path, 'rb') as f:
+        upload = requests.post(
+            f"{get_base_url()}/files",
+            headers=get_headers(),
+            data={'purpose': 'batch'},
+            files={'file': (os.path.basename(path), f, 'application/jsonl')},
+            timeout=300
+        )
+    upload.raise_for_status()
+
+    batch = requests.post(
+        f"{get_base_url()}/batches",
+        headers=get_headers(),
+        json={
+            'input_file_id': upload.json()['id'],
+            'endpoint': '/v1/chat/completions',
+            'completion_window': '24h'
+        },
+        timeout=60
+    )
+    batch.raise_for_status()
+    return batch.json()['id']
+
+def wait_for_batch(batch_id, poll_interval=POLL_INTERVAL_SECONDS):
+    """Polls the batch until it reaches a final status and returns it."""
+    import requests
+
+    while True:
+        response = requests.get(f"{get_base_url()}/batches/{batch_id}", headers=get_headers(), timeout=60)
+        response.raise_for_status()
+        batch = response.json()
+        counts = batch.get('request_counts') or {}
+        print(f"Batch {batch_id}: {batch['status']} "
+              f"({counts.get('completed', 0)}/{counts.get('total', 0)} completed, {counts.get('failed', 0)} failed)")
+        if batch['status'] in FINAL_STATUSES:
+            return batch
+        time.sleep(poll_interval)
+
+def iter_file_lines(file_id):
+    """Streams a batch output or error file and yields one parsed JSON line at a time."""
+    import requests
+
+    with requests.get(f"{get_base_url()}/files/{file_id}/content", headers=get_headers(), stream=True, timeout=300) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line:
+                yield json.loads(line)
+
+def iter_batch_results(file_id):
+    """Streams a batch output file and yields (custom_id, reply) pairs.
+
+    reply is None for requests that failed inside the batch.
+    """
+    for result in iter_file_lines(file_id):
+        custom_id = result['custom_id']
+        body = (result.get('response') or {}).get('body') or {}
+        if result.get('error') or not body.get('choices'):
+            print(f"Batch request {custom_id} failed: {result.get('error') or body.get('error')}")
+            yield custom_id, None
+            continue
+        yield custom_id, body['choices'][0]['message']['content']
+
+def log_batch_errors(file_id):
+    """Prints every request of the batch error file and returns how many failed."""
+    failed = 0
+    for result in iter_file_lines(file_id):
+        error = result.get('error') or ((result.get('response') or {}).get('body') or {}).get('error')
+        print(f"Batch request {result.get('custom_id')} failed: {error}")
+        failed += 1
+    return failed
+
+def save_job_state(state_file, batches):
+    with open(state_file, 'w') as f:
+        json.dump({'batches': batches}, f)
+
+def run_batch_job(job_name, build_requests, handle_result, poll_interval=POLL_INTERVAL_SECONDS):
+    """Submits, polls and applies one batch job, resuming after interruptions.
+
+    build_requests() is only called when no batch for job_name is in flight;
+    requests beyond the Batch API limits go to further batches of the same job.
+    handle_result(custom_id, reply) is called once per result and must raise
+    when the result could not be saved. Only ids it returned for are recorded,
+    so a job stopped by an error keeps its state and the next run applies the
+    remaining results.
+    """
+    state_dir = get_state_dir()
+    os.makedirs(state_dir, exist_ok=True)
+    state_file = os.path.join(state_dir, f"{job_name}.json")
+    done_file = os.path.join(state_dir, f"{job_name}.done")
+
+    if os.path.exists(state_file):
+        with open(state_file, 'r') as f:
+            state = json.load(f)
+        # State files written before jobs were split hold a single batch id
+        batches = state.get('batches') or [{'batch_id': state['batch_id']}]
+        print(f"Resuming batch job '{job_name}' ({len(batches)} batches)")
+    else:
+        input_files = write_batch_files(os.path.join(state_dir, job_name), build_requests())
+        if not input_files:
+            print(f"No requests to submit for batch job '{job_name}'")
+            return 0
+        batches = [{'input_file': path, 'count': count} for path, count in input_files]
+        save_job_state(state_file, batches)
+
+    # The state is saved after every submission, so a restarted run only submits
+    # the files that are not in flight yet
+    for batch_state in batches:
+        if not batch_state.get('batch_id'):
+            batch_state['batch_id'] = submit_batch(batch_state['input_file'])
+            save_job_state(state_file, batches)
+            print(f"Submitted batch job '{job_name}' with {batch_state['count']} requests ({batch_state['batch_id']})")
+
+    done_ids = set()
+    if os.path.exists(done_file):
+        with open(done_file, 'r') as f:
+            done_ids = {line.strip() for line in f if line.strip()}
+
+    handled = 0
+    failed = 0
+    for batch_state in batches:
+        if batch_state.get('applied'):
+            continue
+        batch = wait_for_batch(batch_state['batch_id'], poll_interval)
+
+        # Failed requests go to a separate error file, not to the output file
+        batch_failed = log_batch_errors(batch['error_file_id']) if batch.get('error_file_id') else 0
+        failed += batch_failed
+        if not batch.get('output_file_id'):
+            print(f"Batch {batch['id']} ended with status '{batch['status']}' and no output ({batch_failed} failed requests)")
+        else:
+            with open(done_file, 'a') as done:
+                for custom_id, reply in iter_batch_results(batch['output_file_id']):
+                    if custom_id in done_ids:
+                        continue
+                    if reply is not None:
+                        handle_result(custom_id, reply)
+                        handled += 1
+                    done.write(custom_id + '\n')
+                    done.flush()
+
+        batch_state['applied'] = True
+        save_job_state(state_file, batches)
+
+    # The job is fully applied; the next run starts a new batch
+    os.remove(state_file)
+    if os.path.exists(done_file):
+        os.remove(done_file)
+    for batch_state in batches:
+        if batch_state.get('input_file') and os.path.exists(batch_state['input_file']):
+            os.remove(batch_state['input_file'])
+    print(f"Batch job '{job_name}' applied {handled} results, {failed} requests failed")
+    return handled
@@ -0,0 +1,61 @@
+import os
+import json
+from functools import lru_cache
+
+from ai_news_pipeline.config import load_environment
+
+# Summarization tiers, checked in order: an article goes to the first tier whose
+# max_input_tokens covers its measured length (None or missing means no limit).
+# input_budget_tokens is how much of the article the tier's model gets to read.
+DEFAULT_TIERS = [
+    {'name': 'short', 'model': 'gpt-4o-mini', 'max_input_tokens': 1500, 'input_budget_tokens': 1500, 'max_tokens': 250},
+    {'name': 'medium', 'model': 'gpt-4o-mini', 'max_input_tokens': 3000, 'input_budget_tokens': 3000, 'max_tokens': 400},
+    {'name': 'long', 'model': 'gpt-4', 'max_input_tokens': None, 'input_budget_tokens': 6000, 'max_tokens': 500},
+]
+
+# Excerpt length for a routing-file tier without input_budget_tokens
+DEFAULT_INPUT_BUDGET_TOKENS = 1000
+
+@lru_cache(maxsize=None)
+def get_tiers():
+    """Returns the tiers, read from SUMMARY_ROUTING_FILE if it is set.
+
+    The file is JSON with a "tiers" list in the same shape as DEFAULT_TIERS.
+    """
+    load_environment()
+    routing_file = os.getenv('SUMMARY_ROUTING_FILE')
+    if not routing_file:
+        return DEFAULT_TIERS
+    with open(routing_file, 'r') as f:
+        return json.load(f).get('tiers', DEFAULT_TIERS)
+
+@lru_cache(maxsize=None)
+def get_encoding():
+    # tiktoken is optional; without it lengths are estimated from characters
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding('cl100k_base')
+
+def count_tokens(text):
+    encoding = get_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+def truncate_to_tokens(text, budget):
+    encoding = get_encoding()
+    if encoding is None:
+        return text[:budget * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= budget else encoding.decode(tokens[:budget])
+
+def choose_tier(text):
+    """Returns the summarization tier for an article from its measured length."""
+    tiers = get_tiers()
+    tokens = count_tokens(text)
+    for tier in tiers:
+        if tier.get('max_input_tokens') is None or tokens <= tier['max_input_tokens']:
+            return tier
+    return tiers[-1]
@@ -0,0 +1,116 @@
+import sys
+
+# The 'search_vector' column and its GIN index are maintained by merge.update_all_summaries()
+from ai_news_pipeline.config import Session
+
+MAX_PAGE_SIZE = 100
+
+# Without a date filter only the newest matches are ranked, so common terms
+# ("ai") do not compute ts_rank_cd over hundreds of thousands of rows. The
+# (date DESC, id DESC) index from merge.ensure_search_index lets Postgres stop
+# after this many matches instead of sorting all of them.
+MAX_RANKED_CANDIDATES = 5000
+
+def search_summaries(query, source=None, date_from=None, date_to=None, relevance=None, limit=20, offset=0):
+    """Ranked full-text search over all_summaries joined with all_relevance_4o.
+
+    `query` uses web search syntax ("openai jobs", "\"large language model\"",
+    "ai -crypto"). Optional filters narrow by source, date range and relevance;
+    date_from is inclusive and date_to is exclusive. Returns a dict with the
+    page of results and whether more pages exist.
+
+    When neither date_from nor date_to is given, ranking is limited to the
+    newest MAX_RANKED_CANDIDATES matches. On the last page of that window
+    'older_matches' tells whether matches beyond it exist; a date filter
+    reaches them.
+    """
+    import sqlalchemy as sa
+    from sqlalchemy.exc import SQLAlchemyError
+
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    offset = max(0, int(offset))
+
+    filters = ["a.search_vector @@ q.query"]
+    params = {'query': query, 'limit': limit + 1, 'offset': offset, 'candidates': MAX_RANKED_CANDIDATES}
+    if source:
+        filters.append("a.source = :source")
+        params['source'] = source
+    if date_from:
+        filters.append("a.date >= :date_from")
+        params['date_from'] = date_from
+    if date_to:
+        filters.append("a.date < :date_to")
+        params['date_to'] = date_to
+    if relevance:
+        filters.append("r.relevance = :relevance")
+        params['relevance'] = relevance
+
+    limit_candidates = not (date_from or date_to)
+    candidate_limit = "LIMIT :candidates" if limit_candidates else ""
+    match_sql = f"""
+        FROM all_summaries a
+        CROSS JOIN websearch_to_tsquery('english', :query) AS q(query)
+        LEFT JOIN all_relevance_4o r ON r.id = a.id
+        WHERE {' AND '.join(filters)}
+    """
+
+    # Fetch one extra row to know whether another page exists without a COUNT(*)
+    # Snippets are built only for the returned page, not for every match
+    search_query = sa.text(f"""
+        SELECT page.id, page.url, page.title, page.source, page.date, page.relevance, page.explanation, page.rank,
+               ts_headline('english', page.summary, page.query, 'MaxFragments=2, MaxWords=30') AS snippet
+        FROM (
+            SELECT c.*, ts_rank_cd(c.search_vector, c.query) AS rank
+            FROM (
+                SELECT a.id, a.url, a.title, a.source, a.date, a.summary, a.search_vector,
+                       r.relevance, r.explanation, q.query
+                {match_sql}
+                ORDER BY a.date DESC, a.id DESC
+                {candidate_limit}
+            ) c
+            ORDER BY rank DESC, c.date DESC, c.id DESC
+            LIMIT :limit OFFSET :offset
+        ) page
+        ORDER BY page.rank DESC, page.date DESC, page.id DESC
+    """)
+
+    # Only asked on the last page of the window: is there a match past it?
+    older_matches_query = sa.text(f"""
+        SELECT 1 {match_sql}
+        ORDER BY a.date DESC, a.id DESC
+        OFFSET :candidates LIMIT 1
+    """)
+
+    older_matches = False
+    try:
+        with Session() as session:
+            rows = session.execute(search_query, params).mappings().all()
+            if limit_candidates and len(rows) <= limit:
+                older_matches = session.execute(older_matches_query, params).first() is not None
+    except SQLAlchemyError as e:
+        print(f"An error occurred with the database: {str(e)}")
+        return {'results': [], 'has_more': False, 'older_matches': False}
+
+    return {
+        'results': [dict(row) for row in rows[:limit]],
+        'has_more': len(rows) > limit,
+        'older_matches': older_matches
+    }
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m ai_news_pipeline search \"<search terms>\"")
+        return 1
+
+    page = search_summaries(' '.join(argv))
+    for result in page['results']:
+        print(f"[{result['rank']:.3f}] {result['date']} | {result['source']} | {result['relevance']} | {result['title']}")
+        print(f"    {result['url']}")
+    if page['has_more']:
+        print("More results available.")
+    elif page['older_matches']:
+        print(f"Only the newest {MAX_RANKED_CANDIDATES} matches were ranked; search a date range for older ones.")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+import os
+import json
+from datetime import datetime
+
+from ai_news_pipeline.config import Session, load_environment
+
+# Where the snapshot lives (SNAPSHOT_DIR) and which file format to write
+# (SNAPSHOT_FORMAT, 'parquet' or 'arrow'). Uncompressed Arrow IPC files can be
+# memory-mapped directly by pyarrow/polars/duckdb.
+def get_snapshot_dir():
+    load_environment()
+    return os.getenv('SNAPSHOT_DIR', 'snapshot')
+
+def get_snapshot_format():
+    load_environment()
+    return os.getenv('SNAPSHOT_FORMAT', 'parquet')
+
+# Low-cardinality text columns stored as dictionaries
+DICTIONARY_COLUMNS = ['source', 'origin_table', 'model', 'tier']
+
+COLUMNS = [
+    ('id', 'int64'),
+    ('url', 'string'),
+    ('title', 'string'),
+    ('author', 'string'),
+    ('summary', 'string'),
+    ('source', 'string'),
+    ('date', 'timestamp'),
+    ('origin_table', 'string'),
+    ('last_updated', 'timestamp'),
+    ('model', 'string'),
+    ('tier', 'string'),
+    ('latency_ms', 'int64'),
+    ('relevance', 'string'),
+    ('explanation', 'string'),
+]
+
+def partition_path(day):
+    # Hive-style directory so readers pick up 'day' as a partition column
+    return os.path.join(get_snapshot_dir(), f"day={day.isoformat()}")
+
+def get_state_path():
+    return os.path.join(get_snapshot_dir(), '_export_state.json')
+
+def get_watermarks():
+    """Returns the newest last_updated and evaluated_at already in the snapshot, or None for an empty snapshot."""
+    state_path = get_state_path()
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, 'r') as f:
+        state = json.load(f)
+    # State files from before the database watermarks hold the export start time
+    watermarks = {}
+    for key in ('merged_until', 'evaluated_until'):
+        value = state.get(key, state.get('exported_since'))
+        watermarks[key] = datetime.fromisoformat(value) if value else datetime.min
+    return watermarks
+
+def save_watermarks(watermarks):
+    os.makedirs(get_snapshot_dir(), exist_ok=True)
+    temp_path = get_state_path() + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump({key: value.isoformat() if value else None for key, value in watermarks.items()}, f)
+    os.replace(temp_path, get_state_path())
+
+def build_table(rows):
+    import pyarrow as pa
+
+    types = {'int64': pa.int64(), 'string': pa.string(), 'timestamp': pa.timestamp('us')}
+    columns = {name: [row[name] for row in rows] for name, _ in COLUMNS}
+    arrays = []
+    fields = []
+    for name, type_name in COLUMNS:
+        array = pa.array(columns[name], type=types[type_name])
+        if name in DICTIONARY_COLUMNS:
+            array = array.dictionary_encode()
+        arrays.append(array)
+        fields.append(pa.field(name, array.type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+def write_partition(day, rows):
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    table = build_table(rows)
+    directory = partition_path(day)
+    os.makedirs(directory, exist_ok=True)
+
+    extension = 'arrow' if get_snapshot_format() == 'arrow' else 'parquet'
+    final_path = os.path.join(directory, f"part-0.{extension}")
+    # Dataset readers skip files starting with '_' or '.', so a half-written or
+    # abandoned temp file is never read as part of the partition
+    temp_path = os.path.join(directory, f"_part-0.{extension}.tmp")
+
+    if extension == 'arrow':
+        feather.write_feather(table, temp_path, compression='uncompressed')
+    else:
+        pq.write_table(table, temp_path, use_dictionary=DICTIONARY_COLUMNS, compression='zstd')
+
+    os.replace(temp_path, final_path)
+    print(f"Exported {len(rows)} rows to {final_path}")
+
+def export_new_partitions():
+    """Writes or rewrites the partition of every day that changed since the last export.
+
+    A day changed when one of its rows was merged (all_summaries.last_updated)
+    or evaluated (all_relevance_4o.evaluated_at) after the newest stamps the
+    previous export read. Partitions are keyed on the article date, so rows
+    merged late for an already exported day, and relevance written after the
+    export, land in the snapshot on the next run. The first run exports every day.
+    """
+    import sqlalchemy as sa
+    from sqlalchemy.exc import SQLAlchemyError
+
+    watermarks = get_watermarks()
+
+    # The watermarks come from the rows themselves, read in the export's
+    # transaction: a merge stamps last_updated before it commits, so the
+    # export's own clock could pass rows that are not visible yet
+    watermark_query = sa.text("""
+        SELECT (SELECT max(last_updated) FROM all_summaries) AS merged_until,
+               (SELECT max(evaluated_at) FROM all_relevance_4o) AS evaluated_until
+    """)
+
+    if watermarks is None:
+        changed_days_query = sa.text("""
+            SELECT DISTINCT a.date::date AS day FROM all_summaries a WHERE a.date IS NOT NULL
+        """)
+    else:
+        changed_days_query = sa.text("""
+            SELECT a.date::date AS day FROM all_summaries a
+            WHERE a.last_updated > :merged_until AND a.date IS NOT NULL
+            UNION
+            SELECT a.date::date AS day FROM all_relevance_4o r
+            JOIN all_summaries a ON a.id = r.id
+            WHERE r.evaluated_at > :evaluated_until AND a.date IS NOT NULL
+        """)
+
+    query = sa.text("""
+        SELECT a.id, a.url, a.title, a.author, a.summary, a.source, a.date, a.origin_table, a.last_updated,
+               a.model, a.tier, a.latency_ms, r.relevance, r.explanation
+        FROM all_summaries a
+        LEFT JOIN all_relevance_4o r ON r.id = a.id
+        WHERE a.date >= :start AND a.date::date = ANY(:days)
+        ORDER BY a.date, a.id
+    """).execution_options(stream_results=True, yield_per=10000)
+
+    partitions_written = 0
+    try:
+        with Session() as session:
+            # One database snapshot for the watermarks and the exported rows
+            session.connection(execution_options={'isolation_level': 'REPEATABLE READ'})
+            new_watermarks = dict(session.execute(watermark_query).mappings().one())
+            for key, value in (watermarks or {}).items():
+                new_watermarks[key] = new_watermarks[key] or value
+
+            changed_days = sorted(row.day for row in session.execute(changed_days_query, watermarks or {}))
+            if changed_days:
+                current_day = None
+                rows = []
+                params = {'start': datetime.combine(changed_days[0], datetime.min.time()), 'days': changed_days}
+                for row in session.execute(query, params).mappings():
+                    day = row['date'].date()
+                    if day != current_day and rows:
+                        write_partition(current_day, rows)
+                        partitions_written += 1
+                        rows = []
+                    current_day = day
+                    rows.append(dict(row))
+                if rows:
+                    write_partition(current_day, rows)
+                    partitions_written += 1
+        save_watermarks(new_watermarks)
+    except SQLAlchemyError as e:
+        print(f"An error occurred with the database: {str(e)}")
+
+    print(f"Snapshot export finished: {partitions_written} partitions written in '{get_snapshot_dir()}'")
+    return partitions_written
+
+def main():
+    print("Starting the snapshot export...")
+    export_new_partitions()
+
+if __name__ == "__main__":
+    main()
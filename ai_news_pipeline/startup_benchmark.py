@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+import statistics
+import subprocess
+
+# Modules timed by default: every pipeline stage plus the command dispatcher
+MODULES = [
+    'ai_news_pipeline.__main__',
+    'ai_news_pipeline.medium_links',
+    'ai_news_pipeline.medium_scraper',
+    'ai_news_pipeline.rss',
+    'ai_news_pipeline.summarize',
+    'ai_news_pipeline.merge',
+    'ai_news_pipeline.evaluate',
+    'ai_news_pipeline.search',
+    'ai_news_pipeline.snapshot',
+    'ai_news_pipeline.openai_batch',
+]
+
+RUNS = 10
+
+def time_command(code, runs=RUNS):
+    """Returns the median wall time in milliseconds of `python -c code` in a fresh interpreter."""
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=project_dir, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    modules = argv or MODULES
+
+    # The bare interpreter start-up is the floor every cron run pays anyway
+    baseline = time_command('pass')
+    print(f"{'python -c pass':<40} {baseline:8.1f} ms")
+    for module in modules:
+        total = time_command(f"import {module}")
+        print(f"{module:<40} {total:8.1f} ms  (+{total - baseline:.1f} ms over the interpreter)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
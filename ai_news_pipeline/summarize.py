@@ -0,0 +1,219 @@
+import os
+import sys
+import time
+from datetime import datetime
+
+from ai_news_pipeline.config import Session, get_db_params, load_environment
+from ai_news_pipeline.merge import ensure_routing_columns
+from ai_news_pipeline.routing import DEFAULT_INPUT_BUDGET_TOKENS, choose_tier, get_tiers, truncate_to_tokens
+
+# Function to retrieve all articles from the database
+def get_all_articles(conn_params):
+    import psycopg2
+
+    try:
+        conn = psycopg2.connect(**conn_params)
+        cursor = conn.cursor()
+        cursor.execute('SELECT id, url, title, source, content FROM articles')
+        articles = cursor.fetchall()
+        cursor.close()
+        conn.close()
+        return articles
+    except Exception as e:
+        print(f"Database error in get_all_articles: {e}")
+        return []
+
+# Function to save summaries to the 'article_summaries' table; database errors are
+# raised so a batch job does not record the result as applied
+def save_summary_to_db(conn_params, summary_data):
+    import psycopg2
+
+    try:
+        conn = psycopg2.connect(**conn_params)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS medium_summaries (
+                id SERIAL PRIMARY KEY,
+                url TEXT UNIQUE,
+                title TEXT,
+                author TEXT,
+                summary TEXT,
+                source TEXT,
+                date TIMESTAMP,
+                model TEXT,
+                tier TEXT,
+                latency_ms INTEGER
+            )
+        ''')
+
+        cursor.execute('''
+            INSERT INTO medium_summaries (url, title, author, summary, source, date, model, tier, latency_ms)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (url) DO UPDATE SET
+                title = EXCLUDED.title,
+                author = EXCLUDED.author,
+                summary = EXCLUDED.summary,
+                source = EXCLUDED.source,
+                date = EXCLUDED.date,
+                model = EXCLUDED.model,
+                tier = EXCLUDED.tier,
+                latency_ms = EXCLUDED.latency_ms
+        ''', (summary_data['url'], summary_data['title'], summary_data['author'],
+              summary_data['summary'], summary_data['source'], summary_data['date'],
+              summary_data.get('model'), summary_data.get('tier'), summary_data.get('latency_ms')))
+
+        conn.commit()
+        cursor.close()
+        conn.close()
+    except Exception as e:
+        print(f"Database error in save_summary_to_db: {e}")
+        raise
+
+# Function to build the chat completion request for one article; returns the tier and the request
+def build_summary_request(text):
+    # Pick the model tier from the full article length, then cut the article
+    # to that tier's input budget so larger models also read more of it
+    tier = choose_tier(text)
+    text = truncate_to_tokens(text, tier.get('input_budget_tokens', DEFAULT_INPUT_BUDGET_TOKENS))
+
+    return tier, {
+        "model": tier['model'],
+        "messages": [
+            {"role": "system", "content": "You are a helpful assistant that summarizes articles."},
+            {"role": "user", "content": f"Please provide a concise summary of the following article:\n\n{text}"}
+        ],
+        "max_tokens": tier['max_tokens'],
+        "temperature": 0.5,
+    }
+
+# Function to summarize text using OpenAI API; returns the summary, the tier that
+# wrote it and the API call latency in milliseconds
+def summarize_text(text):
+    import openai
+
+    load_environment()
+    openai.api_key = os.getenv("OPENAI_API_KEY")
+    if not openai.api_key:
+        raise ValueError("OpenAI API key not found in environment variables")
+
+    tier, request = build_summary_request(text)
+    try:
+        start = time.perf_counter()
+        response = openai.ChatCompletion.create(**request)
+        latency_ms = round((time.perf_counter() - start) * 1000)
+        summary = response['choices'][0]['message']['content'].strip()
+        return summary, tier, latency_ms
+    except Exception as e:
+        print(f"OpenAI API error: {e}")
+        return None, tier, None
+
+# Function to summarize all articles as one asynchronous OpenAI batch job
+def summarize_articles_in_batch(conn_params, articles):
+    from ai_news_pipeline.openai_batch import run_batch_job
+
+    articles_by_id = {f"article-{article[0]}": article for article in articles if article[4]}
+    routed_by_id = {
+        custom_id: build_summary_request(content)
+        for custom_id, (article_id, url, title, source, content) in articles_by_id.items()
+    }
+
+    def handle_result(custom_id, summary):
+        article = articles_by_id.get(custom_id)
+        if not article:
+            print(f"Batch result {custom_id} does not match any article")
+            return
+        article_id, url, title, source, content = article
+        tier, request = routed_by_id[custom_id]
+        save_summary_to_db(conn_params, {
+            'url': url,
+            'title': title,
+            'author': 'N/A',
+            'summary': summary.strip(),
+            'source': source,
+            'date': datetime.now(),
+            'model': request['model'],
+            'tier': tier.get('name'),
+            'latency_ms': None
+        })
+
+    # A batch may only contain requests for one model, so every model gets its own job
+    tiers = get_tiers()
+    handled = 0
+    for model in dict.fromkeys(tier['model'] for tier in tiers):
+        def build_requests(model=model):
+            for custom_id, (tier, request) in routed_by_id.items():
+                if request['model'] == model:
+                    yield {'custom_id': custom_id, 'body': request}
+
+        handled += run_batch_job(f"medium_summaries-{model}", build_requests, handle_result)
+    return handled
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    try:
+        print("Starting article summarization process for all articles...")
+
+        load_environment()
+
+        # Print API key check (first 5 characters for safety)
+        api_key = os.getenv("OPENAI_API_KEY")
+        print(f"API Key: {api_key[:5]}..." if api_key else "API Key not set")
+
+        # Define the database connection parameters from environment variables
+        db_params = get_db_params()
+
+        # Check if all database parameters are set
+        if not all(db_params.values()):
+            raise ValueError("One or more database connection parameters are missing from the .env file")
+
+        # Older medium_summaries tables lack the columns the upsert writes
+        with Session() as session:
+            ensure_routing_columns(session)
+            session.commit()
+
+        articles = get_all_articles(db_params)
+        print(f"Retrieved {len(articles)} articles from database")
+
+        # Bulk backfills: python -m ai_news_pipeline summarize --batch
+        if '--batch' in argv:
+            try:
+                summarize_articles_in_batch(db_params, articles)
+            except Exception as e:
+                # Results not saved yet stay pending; the next --batch run resumes the job
+                print(f"Batch summarization stopped, rerun to resume: {e}")
+        else:
+            for i, article in enumerate(articles, 1):
+                article_id, url, title, source, content = article
+                author = 'N/A'  # Assign 'N/A' to author since it's not available
+                print(f"Processing article {i}/{len(articles)}: ID {article_id}, Title: {title}, Source: {source}")
+
+                summary, tier, latency_ms = summarize_text(content)
+                if summary:
+                    summary_data = {
+                        'url': url,
+                        'title': title,
+                        'author': author,
+                        'summary': summary,
+                        'source': source,
+                        'date': datetime.now(),
+                        'model': tier['model'],
+                        'tier': tier.get('name'),
+                        'latency_ms': latency_ms
+                    }
+                    try:
+                        save_summary_to_db(db_params, summary_data)
+                    except Exception:
+                        continue
+                    print(f"Summary saved for Article ID: {article_id} "
+                          f"(tier: {tier.get('name')}, model: {tier['model']}, {latency_ms} ms)")
+                else:
+                    print(f"Failed to summarize Article ID: {article_id}")
+
+        print("Processing complete")
+    except Exception as e:
+        print(f"An error occurred in the main script: {e}")
+
+if __name__ == "__main__":
+    main()
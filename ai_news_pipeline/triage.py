@@ -0,0 +1,67 @@
+import os
+import re
+import math
+
+from ai_news_pipeline.config import load_environment
+
+# Keyword weights derived from the campaign in evaluate.prompt_template: AI and
+# new models, jobs, economics, threats and opportunities. Negative weights mark
+# topics Medium digests often mix in that are never relevant.
+CAMPAIGN_KEYWORDS = {
+    r'\bai\b': 1.0,
+    r'\bartificial intelligence\b': 1.0,
+    r'\bmachine learning\b': 0.8,
+    r'\bdeep learning\b': 0.7,
+    r'\bgenerative\b': 0.7,
+    r'\bllms?\b': 0.8,
+    r'\b(chat)?gpt\w*': 0.8,
+    r'\bopenai\b': 0.8,
+    r'\b(claude|gemini|llama|mistral|copilot)\b': 0.6,
+    r'\bneural\b': 0.5,
+    r'\bmodels?\b': 0.2,
+    r'\bagents?\b': 0.4,
+    r'\bautomat\w*': 0.7,
+    r'\brobot\w*': 0.5,
+    r'\bjobs?\b': 0.8,
+    r'\bcareers?\b': 0.6,
+    r'\bworkforce\b': 0.7,
+    r'\bemploy\w*': 0.6,
+    r'\blayoffs?\b': 0.7,
+    r'\bhiring\b': 0.5,
+    r'\bskills?\b': 0.4,
+    r'\beconom\w*': 0.7,
+    r'\bproductivity\b': 0.6,
+    r'\bindustr\w*': 0.4,
+    r'\bmarkets?\b': 0.4,
+    r'\bthreats?\b': 0.5,
+    r'\bopportunit\w*': 0.5,
+    r'\bregulat\w*': 0.5,
+    r'\bcrypto\w*': -0.6,
+    r'\bbitcoin\b': -0.6,
+    r'\bnfts?\b': -0.6,
+    r'\brecipes?\b': -0.8,
+    r'\bdating\b': -0.8,
+    r'\bhoroscopes?\b': -0.8,
+    r'\bpoe(m|try)\w*': -0.5,
+}
+
+# Title words weigh more than snippet words
+TITLE_WEIGHT = 2.0
+SNIPPET_WEIGHT = 1.0
+
+COMPILED_KEYWORDS = [(re.compile(pattern, re.IGNORECASE), weight) for pattern, weight in CAMPAIGN_KEYWORDS.items()]
+
+def get_threshold():
+    # Links scoring below TRIAGE_THRESHOLD are parked instead of scraped right away
+    load_environment()
+    return float(os.getenv('TRIAGE_THRESHOLD', '0.35'))
+
+def score_text(text):
+    return sum(weight for pattern, weight in COMPILED_KEYWORDS if pattern.search(text or ''))
+
+def score_link(title, snippet):
+    """Returns a 0..1 relevance estimate for a link from its anchor title and snippet."""
+    total = TITLE_WEIGHT * score_text(title) + SNIPPET_WEIGHT * score_text(snippet)
+    if total <= 0:
+        return 0.0
+    return round(1 - math.exp(-total), 3)
@@ -0,0 +1,157 @@
+import os
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('dotenv')
+
+from ai_news_pipeline import batch_stub_server
+from ai_news_pipeline import openai_batch
+from ai_news_pipeline.openai_batch import run_batch_job
+
+
+class Interrupted(Exception):
+    pass
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(('localhost', 0), batch_stub_server.StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv('OPENAI_BASE_URL', f"http://localhost:{server.server_address[1]}/v1")
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('BATCH_STATE_DIR', str(tmp_path))
+    yield tmp_path
+    server.shutdown()
+    batch_stub_server.failing_custom_ids.clear()
+
+
+def make_requests(model, ids):
+    def build_requests():
+        for custom_id in ids:
+            yield {'custom_id': custom_id, 'body': {'model': model, 'messages': [{'role': 'user', 'content': custom_id}]}}
+    return build_requests
+
+
+def never_called():
+    raise AssertionError("a batch in flight must not be submitted again")
+
+
+def test_resumes_after_interruption_without_reapplying_results(stub):
+    ids = [f"article-{i}" for i in range(5)]
+    applied = []
+
+    def handle_interrupted(custom_id, reply):
+        if len(applied) == 2:
+            raise Interrupted()
+        applied.append(custom_id)
+
+    with pytest.raises(Interrupted):
+        run_batch_job('medium_summaries-gpt-4', make_requests('gpt-4', ids), handle_interrupted, poll_interval=0)
+
+    # The state and the partial .done file survive the interruption
+    assert os.path.exists(stub / 'medium_summaries-gpt-4.json')
+    with open(stub / 'medium_summaries-gpt-4.done') as f:
+        assert f.read().split() == applied
+
+    def handle(custom_id, reply):
+        applied.append(custom_id)
+
+    handled = run_batch_job('medium_summaries-gpt-4', never_called, handle, poll_interval=0)
+
+    assert handled == 3
+    assert sorted(applied) == ids
+    assert not os.path.exists(stub / 'medium_summaries-gpt-4.json')
+    assert not os.path.exists(stub / 'medium_summaries-gpt-4.done')
+
+
+def test_result_that_fails_to_save_is_applied_on_the_next_run(stub):
+    saved = []
+
+    def handle_db_down(custom_id, reply):
+        if custom_id == 'article-2':
+            raise RuntimeError("server closed the connection unexpectedly")
+        saved.append(custom_id)
+
+    with pytest.raises(RuntimeError):
+        run_batch_job('all_relevance_4o', make_requests('gpt-4o-mini', ['article-1', 'article-2', 'article-3']),
+                      handle_db_down, poll_interval=0)
+
+    with open(stub / 'all_relevance_4o.done') as f:
+        assert f.read().split() == ['article-1']
+
+    handled = run_batch_job('all_relevance_4o', never_called, lambda custom_id, reply: saved.append(custom_id),
+                            poll_interval=0)
+
+    assert handled == 2
+    assert saved == ['article-1', 'article-2', 'article-3']
+
+
+def test_large_job_is_split_into_batches_and_resumed(stub, monkeypatch):
+    monkeypatch.setattr(openai_batch, 'MAX_BATCH_REQUESTS', 2)
+    ids = [f"article-{i}" for i in range(5)]
+    applied = []
+    submitted_before = len(batch_stub_server.batches)
+
+    def handle_interrupted(custom_id, reply):
+        if custom_id == 'article-3':
+            raise Interrupted()
+        applied.append(custom_id)
+
+    with pytest.raises(Interrupted):
+        run_batch_job('all_relevance_4o', make_requests('gpt-4o-mini', ids), handle_interrupted, poll_interval=0)
+    assert len(batch_stub_server.batches) - submitted_before == 3
+
+    handled = run_batch_job('all_relevance_4o', never_called, lambda custom_id, reply: applied.append(custom_id),
+                            poll_interval=0)
+
+    assert handled == 2
+    assert applied == ids
+    assert len(batch_stub_server.batches) - submitted_before == 3
+    assert os.listdir(stub) == []
+
+
+def test_per_model_jobs_resume_independently(stub):
+    applied = []
+
+    def handle_interrupted(custom_id, reply):
+        raise Interrupted()
+
+    with pytest.raises(Interrupted):
+        run_batch_job('medium_summaries-gpt-4', make_requests('gpt-4', ['article-1']), handle_interrupted, poll_interval=0)
+
+    def handle(custom_id, reply):
+        applied.append(custom_id)
+
+    # Another model's job is submitted fresh while the first one is still in flight
+    assert run_batch_job('medium_summaries-gpt-4o-mini', make_requests('gpt-4o-mini', ['article-2']), handle, poll_interval=0) == 1
+    assert run_batch_job('medium_summaries-gpt-4', never_called, handle, poll_interval=0) == 1
+    assert applied == ['article-2', 'article-1']
+
+
+def test_failed_requests_are_read_from_the_error_file(stub, capsys):
+    batch_stub_server.failing_custom_ids.update({'article-2', 'article-3'})
+    applied = []
+
+    handled = run_batch_job('all_relevance_4o', make_requests('gpt-4o-mini', ['article-1', 'article-2', 'article-3']),
+                            lambda custom_id, reply: applied.append(custom_id), poll_interval=0)
+
+    assert handled == 1
+    assert applied == ['article-1']
+    output = capsys.readouterr().out
+    assert 'Batch request article-2 failed' in output
+    assert 'Batch request article-3 failed' in output
+
+
+def test_batch_where_every_request_failed(stub, capsys):
+    batch_stub_server.failing_custom_ids.add('article-1')
+
+    handled = run_batch_job('all_relevance_4o', make_requests('gpt-4o-mini', ['article-1']),
+                            lambda custom_id, reply: None, poll_interval=0)
+
+    assert handled == 0
+    assert '1 failed requests' in capsys.readouterr().out
+    assert not os.path.exists(stub / 'all_relevance_4o.json')
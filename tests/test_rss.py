@@ -0,0 +1,76 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('feedparser')
+pytest.importorskip('bs4')
+
+from ai_news_pipeline.rss import fetch_feed, parse_rss_feed
+
+FEED = '''<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test feed</title>
+    <item>
+      <title>Agents at work — what changes</title>
+      <link>/2024/agents-at-work/</link>
+      <author>Jane Doe</author>
+      <description>&lt;p&gt;How AI agents change jobs.&lt;/p&gt;</description>
+    </item>
+  </channel>
+</rss>
+'''.encode('utf-8')
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/old-feed':
+            self.send_response(301)
+            self.send_header('Location', '/tag/ai/feed/')
+            self.end_headers()
+            return
+        self.send_response(200)
+        # Servers send mixed-case header names
+        self.send_header('Content-Type', 'application/rss+xml; charset=UTF-8')
+        self.send_header('Content-Length', str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RecordingCursor:
+    def __init__(self):
+        self.rows = []
+
+    def execute(self, query, params=None):
+        self.rows.append(params)
+
+
+@pytest.fixture
+def feed_server():
+    server = ThreadingHTTPServer(('localhost', 0), FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_downloaded_feed_is_parsed_and_stored(feed_server):
+    content, headers = fetch_feed(f"{feed_server}/old-feed")
+    assert content == FEED
+
+    cursor = RecordingCursor()
+    parse_rss_feed(f"{feed_server}/old-feed", 'Test', cursor, content, headers)
+
+    assert len(cursor.rows) == 1
+    url, title, author, summary, source, _ = cursor.rows[0]
+    # Relative links resolve against the final URL after the redirect
+    assert url == f"{feed_server}/2024/agents-at-work/"
+    assert title == 'Agents at work — what changes'
+    assert author == 'Jane Doe'
+    assert summary == 'How AI agents change jobs.'
+    assert source == 'Test'